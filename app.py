@@ -8,24 +8,40 @@
 # the user with raw forecast numbers.
 # ============================================================
 
+import random
 import streamlit as st
-import pandas as pd
-import numpy as np
 from datetime import date
+from typing import TYPE_CHECKING, Callable, Final
+
+from outfits import BOTTOMS, recommend_outfit
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # ============================================================
-# Page Configuration
+# Lookup Tables
 # ============================================================
-st.set_page_config(
-    page_title="FitCast – Outfit Weather Assistant",
-    layout="wide",
-)
+# Mock (low, high) temperature range per city
+_CITY_BASE = {
+    "Miami": (75, 85),
+    "New York": (60, 72),
+    "Chicago": (55, 68),
+    "Los Angeles": (65, 78),
+}
+
+# Perceived temperature offset (°F) per comfort level
+_COMFORT_ADJ = {
+    "I am a furnace": 6,
+    "I run warm": 3,
+    "I am normal": 0,
+    "I run cold": -3,
+    "I am freezing all the time": -6,
+}
 
 # ============================================================
-# Custom CSS (light blue theme)
+# Static Page Content
 # ============================================================
-st.markdown(
-    """
+_CSS: Final[str] = """
     <style>
         .main {
             background-color: #e6f4ff;
@@ -37,18 +53,103 @@ st.markdown(
             color: #1f2d3d;
         }
     </style>
-    """,
-    unsafe_allow_html=True
+    """
+
+_HOME_MD: Final[str] = """
+        FitCast helps you decide what to wear without overthinking it.
+
+        Instead of showing raw forecast numbers, this app translates
+        weather conditions into a **clear, wearable outfit idea**.
+
+        Use the sidebar to customize your preferences and generate
+        an outfit suggestion tailored to *you*.
+        """
+
+_HCI_MD: Final[str] = """
+        **Target users**
+        - Students and young professionals getting dressed for class, work, or social plans  
+        - People who want guidance without analyzing weather charts  
+
+        **Usability goals**
+        - **Effectiveness:** Convert weather data into one clear outfit suggestion  
+        - **Efficiency:** All controls live in the sidebar; one click generates results  
+        - **Learnability:** Uses familiar widgets (dropdowns, radio buttons, checkboxes)  
+        - **User satisfaction:** Friendly language and comfort-based choices  
+
+        **HCI principles applied**
+        - **Visibility & feedback:** Success and info messages explain system state  
+        - **Consistency:** Light blue theme and layout match my Project 1 usability tool  
+        - **Error prevention:** Pages guide users instead of failing silently  
+        - **Match with the real world:** Comfort levels like “I am a furnace” instead of numbers  
+
+        This design prioritizes **decision support**, not raw data display.
+        """
+
+# ============================================================
+# Page Configuration
+# ============================================================
+st.set_page_config(
+    page_title="FitCast – Outfit Weather Assistant",
+    layout="wide",
 )
 
+# ============================================================
+# Custom CSS (light blue theme)
+# ============================================================
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# ============================================================
+# URL Settings Helpers
+# ============================================================
+def _read_url_settings():
+    """
+    Read outfit settings saved in the URL by a previous session.
+    Returns an empty dict if the link does not name a known city.
+    """
+    params = st.query_params
+
+    if params.get("city") not in _CITY_BASE:
+        return {}
+
+    try:
+        day = date.fromisoformat(params.get("day", ""))
+    except ValueError:
+        day = date.today()
+
+    return {
+        "city": params["city"],
+        "style": params.get("style"),
+        "day": day,
+        "comfort": params.get("comfort"),
+    }
+
+
+def _option_index(options, value):
+    """
+    Position of value in options, falling back to the first option.
+    """
+    return options.index(value) if value in options else 0
+
+
 # ============================================================
 # Session State Initialization
 # ============================================================
-if "generate_outfit" not in st.session_state:
-    st.session_state.generate_outfit = False
+_DEFAULTS = {
+    "generate_outfit": False,
+    "weather_data": None,
+    "url_settings": None,  # filled from the URL on the first run
+}
+
+for key, value in _DEFAULTS.items():
+    st.session_state.setdefault(key, value)
+
+# Read once per session so later URL updates don't reset the widgets
+if st.session_state.url_settings is None:
+    st.session_state.url_settings = _read_url_settings()
+    if st.session_state.url_settings:
+        st.session_state.generate_outfit = True
 
-if "weather_data" not in st.session_state:
-    st.session_state.weather_data = None
+url_settings = st.session_state.url_settings
 
 # ============================================================
 # Sidebar – Navigation
@@ -68,34 +169,38 @@ st.sidebar.subheader("Outfit Settings")
 # ============================================================
 city = st.sidebar.selectbox(
     "City",
-    ["Miami", "New York", "Chicago", "Los Angeles"]
+    list(_CITY_BASE),
+    index=_option_index(list(_CITY_BASE), url_settings.get("city"))
 )
 
 style = st.sidebar.selectbox(
     "Style",
-    ["Cozy", "Casual", "Dressy", "Sporty"]
+    list(BOTTOMS),
+    index=_option_index(list(BOTTOMS), url_settings.get("style"))
 )
 
 selected_day = st.sidebar.date_input(
     "Day",
-    value=date.today()
+    value=url_settings.get("day", date.today())
 )
 
 comfort_level = st.sidebar.radio(
     "My comfort level",
-    [
-        "I am a furnace",
-        "I run warm",
-        "I am normal",
-        "I run cold",
-        "I am freezing all the time",
-    ]
+    list(_COMFORT_ADJ),
+    index=_option_index(list(_COMFORT_ADJ), url_settings.get("comfort"))
 )
 
 show_shoes = st.sidebar.checkbox("Show shoe suggestions", value=True)
 
 if st.sidebar.button("Get my outfit"):
     st.session_state.generate_outfit = True
+    # Save the settings in the URL so reloads and shared links keep them
+    st.query_params.update(
+        city=city,
+        day=selected_day.isoformat(),
+        comfort=comfort_level,
+        style=style,
+    )
 
 # ============================================================
 # Title
@@ -108,193 +213,153 @@ st.caption("Weather-powered outfit ideas with a little HCI sprinkled in.")
 # Helper Functions
 # ============================================================
 
-def get_mock_weather(city):
+@st.cache_data(ttl=3600)
+def get_mock_weather(city: str, day: date) -> dict:
     """
     Returns simplified mock weather data.
     Focus is usability, not forecast accuracy.
+    Cached per city + day so reruns reuse the same forecast.
     """
-    base = {
-        "Miami": (75, 85),
-        "New York": (60, 72),
-        "Chicago": (55, 68),
-        "Los Angeles": (65, 78),
-    }
+    # A str seed is hashed with sha512, so it is stable across processes
+    rng = random.Random(f"{city}|{day.isoformat()}")
 
-    low, high = base[city]
-    feels_like = int((low + high) / 2 + np.random.randint(-2, 3))
+    low, high = _CITY_BASE[city]
+    feels_like = (low + high) // 2 + rng.randint(-2, 2)
 
     return {
         "low": low,
         "high": high,
         "feels_like": feels_like,
-        "rain_chance": np.random.choice(["Low", "Medium", "High"])
+        "rain_chance": rng.choice(("Low", "Medium", "High"))
     }
 
 
-def adjust_for_comfort(feels_like, comfort):
+@st.cache_data
+def _forecast_df(low: int, high: int, feels: int, rain: str) -> "pd.DataFrame":
     """
-    Adjust perceived temperature based on comfort level.
+    Build the Forecast Details table once per distinct forecast.
     """
-    adjustments = {
-        "I am a furnace": 6,
-        "I run warm": 3,
-        "I am normal": 0,
-        "I run cold": -3,
-        "I am freezing all the time": -6,
-    }
+    import pandas as pd
 
-    return feels_like + adjustments[comfort]
+    return pd.DataFrame(
+        {
+            "Metric": ["Low Temp", "High Temp", "Feels Like", "Rain Chance"],
+            "Value": [f"{low}°F", f"{high}°F", f"{feels}°F", rain],
+        }
+    )
 
 
-def generate_outfit(adjusted_temp, style):
+def adjust_for_comfort(feels_like, comfort):
     """
-    Generate outfit recommendations based on adjusted temp + style.
+    Adjust perceived temperature based on comfort level.
     """
-    if adjusted_temp >= 80:
-        top = "light tank or breathable tee"
-        outer = "no jacket needed"
-    elif adjusted_temp >= 70:
-        top = "short-sleeve shirt"
-        outer = "optional light layer"
-    elif adjusted_temp >= 60:
-        top = "long-sleeve top"
-        outer = "light jacket or cardigan"
-    else:
-        top = "warm sweater"
-        outer = "jacket or coat"
-
-    bottoms = {
-        "Cozy": "soft pants or leggings",
-        "Casual": "jeans",
-        "Dressy": "tailored pants or skirt",
-        "Sporty": "athletic bottoms",
-    }
-
-    return top, outer, bottoms[style]
-
-
-def shoe_suggestion(adjusted_temp, rain):
-    if rain == "High":
-        return "water-resistant shoes"
-    if adjusted_temp >= 75:
-        return "sandals or breathable sneakers"
-    elif adjusted_temp >= 60:
-        return "sneakers or flats"
-    else:
-        return "closed-toe shoes or boots"
+    return feels_like + _COMFORT_ADJ[comfort]
 
 
 # ============================================================
 # HOME PAGE
 # ============================================================
-if page == "Home":
+def _render_home():
     st.subheader("Welcome")
 
-    st.write(
-        """
-        FitCast helps you decide what to wear without overthinking it.
-
-        Instead of showing raw forecast numbers, this app translates
-        weather conditions into a **clear, wearable outfit idea**.
+    st.write(_HOME_MD)
 
-        Use the sidebar to customize your preferences and generate
-        an outfit suggestion tailored to *you*.
-        """
-    )
 
 # ============================================================
 # OUTFIT PLANNER PAGE
 # ============================================================
-elif page == "Outfit Planner":
+def _render_planner(city, style, selected_day, comfort_level, show_shoes):
     st.subheader("Your Outfit Suggestion")
 
     if not st.session_state.generate_outfit:
         st.info("Choose your preferences in the sidebar and click **Get my outfit**.")
-    else:
-        weather = get_mock_weather(city)
-        st.session_state.weather_data = weather
+        return
+
+    weather = get_mock_weather(city, selected_day)
+    st.session_state.weather_data = weather
+
+    adjusted_temp = adjust_for_comfort(
+        weather["feels_like"],
+        comfort_level
+    )
 
-        adjusted_temp = adjust_for_comfort(
-            weather["feels_like"],
-            comfort_level
-        )
+    top, outer, bottom, shoes = recommend_outfit(
+        adjusted_temp,
+        style,
+        weather["rain_chance"]
+    )
 
-        top, outer, bottom = generate_outfit(adjusted_temp, style)
+    st.success(f"Outfit ready for **{city}** on **{selected_day}**")
 
-        st.success(f"Outfit ready for **{city}** on **{selected_day}**")
+    col1, col2 = st.columns(2)
 
-        col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("### Outfit Breakdown")
+        st.markdown(f"**Top:** {top}")
+        st.markdown(f"**Outer layer:** {outer}")
+        st.markdown(f"**Bottom:** {bottom}")
+        st.markdown(f"**Style vibe:** {style}")
 
-        with col1:
-            st.markdown("### Outfit Breakdown")
-            st.markdown(f"**Top:** {top}")
-            st.markdown(f"**Outer layer:** {outer}")
-            st.markdown(f"**Bottom:** {bottom}")
-            st.markdown(f"**Style vibe:** {style}")
+    with col2:
+        st.markdown("### Comfort Logic")
+        st.markdown(f"- Feels like: **{weather['feels_like']}°F**")
+        st.markdown(f"- Adjusted for comfort: **{adjusted_temp}°F**")
+        st.markdown(f"- Rain chance: **{weather['rain_chance']}**")
 
-        with col2:
-            st.markdown("### Comfort Logic")
-            st.markdown(f"- Feels like: **{weather['feels_like']}°F**")
-            st.markdown(f"- Adjusted for comfort: **{adjusted_temp}°F**")
-            st.markdown(f"- Rain chance: **{weather['rain_chance']}**")
+    if show_shoes:
+        st.markdown(f"### Shoes 👟\n**{shoes}**")
 
-        if show_shoes:
-            shoes = shoe_suggestion(adjusted_temp, weather["rain_chance"])
-            st.markdown(f"### Shoes 👟\n**{shoes}**")
 
 # ============================================================
 # FORECAST DETAILS PAGE
 # ============================================================
-elif page == "Forecast Details":
+def _render_forecast():
     st.subheader("Forecast Details")
 
     if st.session_state.weather_data is None:
         st.info("Generate an outfit first to view forecast details.")
-    else:
-        data = st.session_state.weather_data
+        return
+
+    data = st.session_state.weather_data
 
-        df = pd.DataFrame(
-            {
-                "Metric": ["Low Temp", "High Temp", "Feels Like", "Rain Chance"],
-                "Value": [
-                    f"{data['low']}°F",
-                    f"{data['high']}°F",
-                    f"{data['feels_like']}°F",
-                    data["rain_chance"],
-                ],
-            }
-        )
+    df = _forecast_df(
+        data["low"],
+        data["high"],
+        data["feels_like"],
+        data["rain_chance"],
+    )
 
-        st.table(df)
+    st.table(df)
+
+    st.caption(
+        "Forecast data is intentionally simplified to support usability testing."
+    )
 
-        st.caption(
-            "Forecast data is intentionally simplified to support usability testing."
-        )
 
 # ============================================================
 # HCI / UX PAGE
 # ============================================================
-elif page == "About HCI Choices":
+def _render_hci():
     st.subheader("About the HCI / UX choices")
 
-    st.markdown(
-        """
-        **Target users**
-        - Students and young professionals getting dressed for class, work, or social plans  
-        - People who want guidance without analyzing weather charts  
+    st.markdown(_HCI_MD)
 
-        **Usability goals**
-        - **Effectiveness:** Convert weather data into one clear outfit suggestion  
-        - **Efficiency:** All controls live in the sidebar; one click generates results  
-        - **Learnability:** Uses familiar widgets (dropdowns, radio buttons, checkboxes)  
-        - **User satisfaction:** Friendly language and comfort-based choices  
-
-        **HCI principles applied**
-        - **Visibility & feedback:** Success and info messages explain system state  
-        - **Consistency:** Light blue theme and layout match my Project 1 usability tool  
-        - **Error prevention:** Pages guide users instead of failing silently  
-        - **Match with the real world:** Comfort levels like “I am a furnace” instead of numbers  
 
-        This design prioritizes **decision support**, not raw data display.
-        """
-    )
+# ============================================================
+# Page Dispatch
+# ============================================================
+_PAGES: dict[str, Callable[[], None]] = {
+    "Home": _render_home,
+    "Outfit Planner": lambda: _render_planner(
+        city, style, selected_day, comfort_level, show_shoes
+    ),
+    "Forecast Details": _render_forecast,
+    "About HCI Choices": _render_hci,
+}
+
+# A restored URL can land straight on Forecast Details; rebuild its data
+# from the (cached) mock forecast instead of asking for a new outfit.
+if url_settings and st.session_state.weather_data is None:
+    st.session_state.weather_data = get_mock_weather(city, selected_day)
+
+_PAGES[page]()
@@ -0,0 +1,77 @@
+# ============================================================
+# FitCast – Outfit Lookup Tables
+#
+# Purpose:
+# Every possible outfit is precomputed here once. Streamlit
+# reruns app.py on each interaction, but imported modules are
+# cached, so this table is only built when the app starts.
+# ============================================================
+
+from bisect import bisect_right
+
+# Temperature bands (°F): below 60, 60–69, 70–79, 80 and up
+BINS = (60, 70, 80)
+
+TOP_OUTER = (
+    ("warm sweater", "jacket or coat"),
+    ("long-sleeve top", "light jacket or cardigan"),
+    ("short-sleeve shirt", "optional light layer"),
+    ("light tank or breathable tee", "no jacket needed"),
+)
+
+BOTTOMS = {
+    "Cozy": "soft pants or leggings",
+    "Casual": "jeans",
+    "Dressy": "tailored pants or skirt",
+    "Sporty": "athletic bottoms",
+}
+
+# Shoe bands (°F): below 60, 60–74, 75 and up
+SHOE_BINS = (60, 75)
+
+SHOES = (
+    "closed-toe shoes or boots",
+    "sneakers or flats",
+    "sandals or breathable sneakers",
+)
+
+# Union of the outfit and shoe breakpoints, so one band picks both
+TEMP_BINS = sorted(set(BINS) | set(SHOE_BINS))
+
+
+def _compute_outfit(band, style, rain_high):
+    """
+    Build the (top, outer, bottom, shoes) outfit for one temperature band.
+    """
+    # Any temperature inside the band gives the same answer; use its floor
+    temp = TEMP_BINS[band - 1] if band else TEMP_BINS[0] - 1
+
+    top, outer = TOP_OUTER[bisect_right(BINS, temp)]
+
+    if rain_high:
+        shoes = "water-resistant shoes"
+    else:
+        shoes = SHOES[bisect_right(SHOE_BINS, temp)]
+
+    return top, outer, BOTTOMS[style], shoes
+
+
+# Every possible outfit, indexed as OUTFIT_TABLE[band][style][rain_high]
+OUTFIT_TABLE = tuple(
+    {
+        style: tuple(
+            _compute_outfit(band, style, rain_high)
+            for rain_high in (False, True)
+        )
+        for style in BOTTOMS
+    }
+    for band in range(len(TEMP_BINS) + 1)
+)
+
+
+def recommend_outfit(adjusted_temp, style, rain_chance):
+    """
+    Look up (top, outer, bottom, shoes) for an adjusted temp + style.
+    """
+    band = bisect_right(TEMP_BINS, adjusted_temp)
+    return OUTFIT_TABLE[band][style][rain_chance == "High"]